@@ -5,6 +5,7 @@
 __author__ = ["fkiraly"]
 __all__ = []
 
+import pytest
 from sklearn.preprocessing import StandardScaler
 
 from sktime.classification.compose import ClassifierPipeline
@@ -15,12 +16,27 @@ from sktime.transformations.series.impute import Imputer
 from sktime.utils._testing.estimator_checks import _assert_array_almost_equal
 from sktime.utils._testing.panel import _make_classification_y, _make_panel_X
 
+# random seed for generating data to keep tests exactly reproducible
+RAND_SEED = 42
 
-def test_dunder_mul():
-    """Test the mul dunder method."""
-    RAND_SEED = 42
+
+@pytest.fixture(scope="module")
+def panel_data():
+    """Seeded classification training data, shared between tests of this module.
+
+    Returns
+    -------
+    X : pd.DataFrame, nested_univ mtype, 10 training instances
+    y : pd.Series, training labels for X
+    """
     y = _make_classification_y(n_instances=10, random_state=RAND_SEED)
     X = _make_panel_X(n_instances=10, n_timepoints=20, random_state=RAND_SEED, y=y)
+    return X, y
+
+
+def test_dunder_mul(panel_data):
+    """Test the mul dunder method."""
+    X, y = panel_data
     X_test = _make_panel_X(n_instances=5, n_timepoints=20, random_state=RAND_SEED)
 
     t1 = ExponentTransformer(power=4)
@@ -35,18 +51,21 @@ def test_dunder_mul():
     assert isinstance(t12c_2, ClassifierPipeline)
     assert isinstance(t12c_3, ClassifierPipeline)
 
+    # t1 * t2 * c is parsed as (t1 * t2) * c, so t12c_3 is constructed the same
+    #   way as t12c_2, hence it suffices to check it has the same structure/params
+    #   we compare repr rather than get_params(deep=True), since the latter contains
+    #   the component estimators, and estimators compare by reference, not by value
+    assert repr(t12c_3) == repr(t12c_2)
+
     y_pred = c.fit(X, y).predict(X_test)
 
     _assert_array_almost_equal(y_pred, t12c_1.fit(X, y).predict(X_test))
     _assert_array_almost_equal(y_pred, t12c_2.fit(X, y).predict(X_test))
-    _assert_array_almost_equal(y_pred, t12c_3.fit(X, y).predict(X_test))
 
 
-def test_mul_sklearn_autoadapt():
+def test_mul_sklearn_autoadapt(panel_data):
     """Test auto-adapter for sklearn in mul."""
-    RAND_SEED = 42
-    y = _make_classification_y(n_instances=10, random_state=RAND_SEED)
-    X = _make_panel_X(n_instances=10, n_timepoints=20, random_state=RAND_SEED, y=y)
+    X, y = panel_data
     X_test = _make_panel_X(n_instances=10, n_timepoints=20, random_state=RAND_SEED)
 
     t1 = ExponentTransformer(power=2)
@@ -27,8 +27,10 @@ import shutil
 import tempfile
 import textwrap
 import zipfile
+from copy import deepcopy
 from datetime import datetime
 from distutils.util import strtobool
+from functools import lru_cache
 from typing import Dict
 from urllib.request import urlretrieve
 
@@ -189,6 +191,45 @@ def _load_dataset(name, split, return_X_y, extract_path=None):
         return X
 
 
+@lru_cache(maxsize=32)
+def _load_provided_tsfile_cached(abspath, return_type=None):
+    """Load provided .ts file, cached (helper function).
+
+    Provided files are shipped with sktime and do not change, so parsing can be
+    cached. Returned objects are shared between calls and must not be modified,
+    use _load_provided_tsfile to obtain copies.
+    """
+    return load_from_tsfile(abspath, return_data_type=return_type)
+
+
+def _copy_panel(X):
+    """Return copy of Panel X which shares no mutable data with X (helper function).
+
+    deepcopy of a pd.DataFrame does not copy objects in cells, e.g., nested
+    pd.Series in the nested_univ mtype, so these cells are copied separately.
+    """
+    if isinstance(X, pd.DataFrame) and (X.dtypes == "object").any():
+        return X.applymap(deepcopy)
+    return deepcopy(X)
+
+
+def _load_provided_tsfile(abspath, return_type=None):
+    """Load provided .ts file into X, y, parsing is cached (helper function).
+
+    Parameters
+    ----------
+        abspath : string, full path of a .ts file in sktime/datasets/data
+        return_type : default = None, mtype of X, passed to load_from_tsfile
+
+    Returns
+    -------
+        X : copy of X as returned by load_from_tsfile, of mtype return_type
+        y : copy of y as returned by load_from_tsfile, np.ndarray
+    """
+    X, y = _load_provided_tsfile_cached(abspath, return_type)
+    return _copy_panel(X), y.copy()
+
+
 def _load_provided_dataset(name, split=None, return_X_y=True, return_type=None):
     """Load baked in time series classification datasets (helper function).
 
@@ -207,15 +248,15 @@ def _load_provided_dataset(name, split=None, return_X_y=True, return_type=None):
     if split in ("TRAIN", "TEST"):
         fname = name + "_" + split + ".ts"
         abspath = os.path.join(MODULE, DIRNAME, name, fname)
-        X, y = load_from_tsfile(abspath, return_data_type=return_type)
+        X, y = _load_provided_tsfile(abspath, return_type)
     # if split is None, load both train and test set
     elif split is None:
         fname = name + "_TRAIN.ts"
         abspath = os.path.join(MODULE, DIRNAME, name, fname)
-        X_train, y_train = load_from_tsfile(abspath, return_data_type=return_type)
+        X_train, y_train = _load_provided_tsfile(abspath, return_type)
         fname = name + "_TEST.ts"
         abspath = os.path.join(MODULE, DIRNAME, name, fname)
-        X_test, y_test = load_from_tsfile(abspath, return_data_type=return_type)
+        X_test, y_test = _load_provided_tsfile(abspath, return_type)
         if isinstance(X_train, np.ndarray):
             X = np.concatenate((X_train, X_test))
         elif isinstance(X_train, pd.DataFrame):
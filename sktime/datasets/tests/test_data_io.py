@@ -26,11 +26,13 @@ from sktime.datasets import (
     load_from_tsfile_to_dataframe,
     load_tsf_to_dataframe,
     load_UCR_UEA_dataset,
+    load_unit_test,
     load_uschange,
     write_dataframe_to_tsfile,
 )
 from sktime.datasets._data_io import MODULE, _convert_tsf_to_hierarchical
 from sktime.datatypes import check_is_mtype
+from sktime.utils._testing.deep_equals import deep_equals
 
 
 def test_load_from_tsfile():
@@ -149,6 +151,29 @@ def test_data_loaders(dataset):
         assert len(X) == checks["len_X"]
 
 
+@pytest.mark.parametrize("return_type", [None, "numpy3D", "pd-multiindex"])
+def test_load_provided_dataset_is_not_shared(return_type):
+    """Test that in-place changes to loaded data do not affect later loads.
+
+    Provided datasets are parsed once and cached, this checks that the loaders
+    return copies of the cache rather than the cached objects.
+    """
+    X, y = load_unit_test(split="train", return_type=return_type)
+    X_expected, y_expected = load_unit_test(split="train", return_type=return_type)
+
+    if return_type is None:
+        X.iloc[0, 0].iloc[0] = -1
+    elif return_type == "numpy3D":
+        X[0, 0, 0] = -1
+    else:
+        X.iloc[0, 0] = -1
+    y[0] = "changed"
+
+    X_reloaded, y_reloaded = load_unit_test(split="train", return_type=return_type)
+    assert deep_equals(X_reloaded, X_expected)
+    np.testing.assert_array_equal(y_reloaded, y_expected)
+
+
 def test_load_from_tsfile_to_dataframe():
     """Test the load_from_tsfile_to_dataframe() function."""
     # Test that an empty file is classed an invalid
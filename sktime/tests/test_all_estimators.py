@@ -11,6 +11,7 @@ import numbers
 import pickle
 import types
 from copy import deepcopy
+from functools import lru_cache
 from inspect import getfullargspec, isclass, signature
 
 import joblib
@@ -55,6 +56,30 @@ from sktime.utils.validation._dependencies import (
     _check_estimator_deps,
 )
 
+# fixture variables which contain an estimator (class or instance)
+#   used to group tests by estimator for pytest-xdist
+ESTIMATOR_FIXTURE_VARS = ["estimator_class", "estimator_instance"]
+
+
+# collection time caches, shared by all tests using BaseFixtureGenerator
+#   pytest_generate_tests is called once per test, and without caching
+#   every call would crawl the registry and construct all test instances again
+#   returned lists must not be mutated, instances are cloned in estimator_instance
+@lru_cache(maxsize=None)
+def _all_estimators_cached(estimator_types=None):
+    """Return all_estimators list for estimator_types, cached."""
+    return all_estimators(
+        estimator_types=estimator_types,
+        return_names=False,
+        exclude_estimators=EXCLUDE_ESTIMATORS,
+    )
+
+
+@lru_cache(maxsize=None)
+def _test_instances_and_names(estimator_class):
+    """Return estimator_class.create_test_instances_and_names(), cached."""
+    return estimator_class.create_test_instances_and_names()
+
 
 class BaseFixtureGenerator:
     """Fixture generator for base testing functionality in sktime.
@@ -144,6 +169,10 @@ class BaseFixtureGenerator:
         #   this is intersection of self.indirect_vixtures with args in fixture_vars
         indirect_vars = list(set(fixture_vars).intersection(self.indirect_fixtures))
 
+        # mark fixtures with xdist group of the estimator, if any estimator fixture
+        #   with --dist loadgroup, tests of the same estimator run on the same worker
+        fixture_prod = self._add_xdist_group_marks(fixture_param_str, fixture_prod)
+
         metafunc.parametrize(
             fixture_param_str,
             fixture_prod,
@@ -151,12 +180,44 @@ class BaseFixtureGenerator:
             indirect=indirect_vars,
         )
 
+    @staticmethod
+    def _add_xdist_group_marks(fixture_param_str, fixture_prod):
+        """Wrap fixtures in pytest.param with xdist_group mark of estimator name.
+
+        Parameters
+        ----------
+        fixture_param_str : str, fixture variable names separated by ","
+            as returned by create_conditional_fixtures_and_names
+        fixture_prod : list of fixtures, or list of tuples of fixtures
+            as returned by create_conditional_fixtures_and_names
+
+        Returns
+        -------
+        fixture_prod : list of pytest.param, with xdist_group mark
+            mark has the name of the estimator class, in the first of
+            "estimator_class" or "estimator_instance" variables in fixture_param_str
+            fixture_prod is returned unchanged if there is no such variable
+        """
+        fixture_vars = fixture_param_str.split(",")
+        est_vars = [x for x in fixture_vars if x in ESTIMATOR_FIXTURE_VARS]
+        if len(est_vars) == 0:
+            return fixture_prod
+        est_ix = fixture_vars.index(est_vars[0])
+
+        def _group_param(fixture):
+            # pytest convention: only multiple variables (2 or more) are tuples
+            if len(fixture_vars) == 1:
+                fixture = (fixture,)
+            est = fixture[est_ix]
+            name = est.__name__ if isclass(est) else type(est).__name__
+            return pytest.param(*fixture, marks=pytest.mark.xdist_group(name=name))
+
+        return [_group_param(fixture) for fixture in fixture_prod]
+
     def _all_estimators(self):
         """Retrieve list of all estimator classes of type self.estimator_type_filter."""
-        return all_estimators(
-            estimator_types=getattr(self, "estimator_type_filter", None),
-            return_names=False,
-            exclude_estimators=EXCLUDE_ESTIMATORS,
+        return _all_estimators_cached(
+            estimator_types=getattr(self, "estimator_type_filter", None)
         )
 
     def generator_dict(self):
@@ -236,7 +297,7 @@ class BaseFixtureGenerator:
         estimator_instance_names = []
         # retrieve all estimator parameters if multiple, construct instances
         for est in estimator_classes_to_test:
-            all_instances_of_est, instance_names = est.create_test_instances_and_names()
+            all_instances_of_est, instance_names = _test_instances_and_names(est)
             estimator_instances_to_test += all_instances_of_est
             estimator_instance_names += instance_names
 
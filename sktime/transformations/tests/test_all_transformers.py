@@ -7,8 +7,57 @@ __all__ = []
 
 from sktime.datatypes import check_is_scitype
 from sktime.tests.test_all_estimators import BaseFixtureGenerator, QuickTester
+from sktime.utils._testing.deep_equals import deep_equals
 from sktime.utils._testing.estimator_checks import _assert_array_almost_equal
 
+# cache of fitted transformers and transform outputs, shared between tests
+#   keys are (estimator class, scenario class)
+#   values are lists of (params, fitted estimator, Xt) tuples
+#   entries are only stored for transformers with inverse_transform capability
+#   that are not excluded from test_transform_inverse_transform_equivalent,
+#   since these are fit/transformed in both that test and test_fit_transform_output
+#   entries are removed when used, but remain if the inverse test is deselected
+_FIT_TRANSFORM_CACHE = dict()
+
+
+def _cache_key(estimator_instance, scenario):
+    """Return key of estimator_instance/scenario in _FIT_TRANSFORM_CACHE."""
+    return type(estimator_instance), type(scenario)
+
+
+def _store_fit_transform(estimator_instance, scenario, Xt):
+    """Store fitted estimator_instance and transform output Xt in cache."""
+    key = _cache_key(estimator_instance, scenario)
+    params = estimator_instance.get_params(deep=False)
+    _FIT_TRANSFORM_CACHE.setdefault(key, []).append((params, estimator_instance, Xt))
+
+
+def _pop_fit_transform(estimator_instance, scenario):
+    """Retrieve and remove fitted estimator and Xt from cache, or run fit/transform.
+
+    Parameters
+    ----------
+    estimator_instance : unfitted transformer, instance of BaseTransformer
+    scenario : TestScenario, run with method_sequence=["fit", "transform"]
+
+    Returns
+    -------
+    estimator : fitted transformer with same params as estimator_instance
+        identical to estimator_instance if there was no cache hit
+    Xt : output of transform after fit, in scenario
+    """
+    entries = _FIT_TRANSFORM_CACHE.get(_cache_key(estimator_instance, scenario), [])
+    params = estimator_instance.get_params(deep=False)
+    for i, (cached_params, estimator, Xt) in enumerate(entries):
+        # deep_equals compares nested estimators by reference,
+        #   so composites with estimator params will not produce a hit
+        if deep_equals(cached_params, params):
+            del entries[i]
+            return estimator, Xt
+
+    Xt = scenario.run(estimator_instance, method_sequence=["fit", "transform"])
+    return estimator_instance, Xt
+
 
 class TransformerFixtureGenerator(BaseFixtureGenerator):
     """Fixture generator for transformer tests.
@@ -69,9 +118,21 @@ class TestAllTransformers(TransformerFixtureGenerator, QuickTester):
         X = scenario.args["transform"]["X"]
         Xt = scenario.run(estimator_instance, method_sequence=["fit", "transform"])
 
+        # fitted estimator and Xt are re-used in inverse_transform test below
+        has_inverse = estimator_instance.get_class_tag(
+            "capability:inverse_transform", False
+        )
+        inverse_test = "test_transform_inverse_transform_equivalent"
+        if has_inverse and not self.is_excluded(inverse_test, type(estimator_instance)):
+            _store_fit_transform(estimator_instance, scenario, Xt)
+
+        # collect tags once, since every get_tag call collects all tags via the MRO
+        #   tags are retrieved from the instance, since they can be set dynamically
+        tags = estimator_instance.get_tags()
+
         X_scitype = scenario.get_tag("X_scitype")
-        trafo_input = estimator_instance.get_tag("scitype:transform-input")
-        trafo_output = estimator_instance.get_tag("scitype:transform-output")
+        trafo_input = tags["scitype:transform-input"]
+        trafo_output = tags["scitype:transform-output"]
 
         # get metadata for X and ensure that X_scitype tag was correct
         valid_X_scitype, _, X_metadata = check_is_scitype(
@@ -121,7 +182,7 @@ class TestAllTransformers(TransformerFixtureGenerator, QuickTester):
         # series-to-series transformers
         if trafo_input == "Series" and trafo_output == "Series":
             if X_scitype == "Series" and Xt_scitype == "Series":
-                if estimator_instance.get_tag("transform-returns-same-time-index"):
+                if tags["transform-returns-same-time-index"]:
                     assert X.shape[0] == Xt.shape[0]
             if X_scitype == "Panel" and Xt_scitype == "Panel":
                 assert X_metadata["n_instances"] == Xt_metadata["n_instances"]
@@ -149,7 +210,8 @@ class TestAllTransformers(TransformerFixtureGenerator, QuickTester):
             return None
 
         X = scenario.args["transform"]["X"]
-        Xt = scenario.run(estimator_instance, method_sequence=["fit", "transform"])
+        # re-use fit/transform result of test_fit_transform_output, if available
+        estimator_instance, Xt = _pop_fit_transform(estimator_instance, scenario)
         Xit = estimator_instance.inverse_transform(Xt)
         if estimator_instance.get_tag("transform-returns-same-time-index"):
             _assert_array_almost_equal(X, Xit)
@@ -286,6 +286,18 @@ def _compare_nested_frame(func, x, y, **kwargs):
             xc = x.iloc[:, i].tolist()
             yc = y.iloc[:, i].tolist()
 
+            # If all cells in the column are series/arrays of equal length, we
+            # compare the stacked cells in a single call, instead of one call
+            # per cell. Primitive columns, which nested frames can also contain,
+            # and unequal length columns are compared cell by cell.
+            cells = xc + yc
+            all_arrays = all(isinstance(c, (pd.Series, np.ndarray)) for c in cells)
+            if all_arrays and len({len(cell) for cell in cells}) == 1:
+                xc_arr = np.stack([np.asarray(xci) for xci in xc])
+                yc_arr = np.stack([np.asarray(yci) for yci in yc])
+                func(xc_arr, yc_arr, **kwargs)
+                continue
+
             # Iterate over rows, checking if individual cells are equal
             for xci, yci in zip(xc, yc):
                 func(xci, yci, **kwargs)
@@ -177,7 +177,8 @@ class TestScenario:
         args_after_call = []
         for i in range(num_calls):
             methodname = method_sequence[i]
-            args = deepcopy(self.get_args(key=arg_sequence[i], obj=obj))
+            # get_args deepcopies, no need to deepcopy again here
+            args = self.get_args(key=arg_sequence[i], obj=obj, deepcopy_args=True)
 
             if methodname != "__init__":
                 res = getattr(obj, methodname)(**args)
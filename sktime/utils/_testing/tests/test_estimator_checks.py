@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Tests for array comparison utilities in _testing.estimator_checks module."""
+
+__all__ = []
+
+import pandas as pd
+import pytest
+
+from sktime.utils._testing.estimator_checks import _assert_array_almost_equal
+from sktime.utils._testing.panel import _make_panel_X
+
+
+def _make_unequal_length_nested():
+    """Return nested_univ DataFrame with series of unequal length."""
+    cells = [pd.Series([1.0, 2.0]), pd.Series([1.0, 2.0, 3.0])]
+    return pd.DataFrame({"var_0": cells})
+
+
+@pytest.mark.parametrize("n_columns", [1, 2])
+def test_assert_array_almost_equal_nested(n_columns):
+    """Test _assert_array_almost_equal on equal length nested frames."""
+    X = _make_panel_X(n_instances=5, n_columns=n_columns, random_state=42)
+    X_perturbed = X.applymap(lambda cell: cell + 1e-8)
+    X_different = X.applymap(lambda cell: cell + 1)
+
+    _assert_array_almost_equal(X, X.copy())
+    _assert_array_almost_equal(X, X_perturbed)
+    with pytest.raises(AssertionError):
+        _assert_array_almost_equal(X, X_different)
+
+
+def test_assert_array_almost_equal_nested_unequal_length():
+    """Test _assert_array_almost_equal on unequal length nested frames."""
+    X = _make_unequal_length_nested()
+    X_different = X.applymap(lambda cell: cell + 1)
+
+    _assert_array_almost_equal(X, _make_unequal_length_nested())
+    with pytest.raises(AssertionError):
+        _assert_array_almost_equal(X, X_different)
+
+
+def test_assert_array_almost_equal_nested_mixed_columns():
+    """Test _assert_array_almost_equal on frames with nested and primitive columns."""
+    X = _make_panel_X(n_instances=5, n_columns=1, random_state=42)
+    X["primitive"] = [float(i) for i in range(5)]
+    X_different = X.copy()
+    X_different["primitive"] = X_different["primitive"] + 1
+
+    _assert_array_almost_equal(X, X.copy())
+    with pytest.raises(AssertionError):
+        _assert_array_almost_equal(X, X_different)